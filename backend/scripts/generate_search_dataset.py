@@ -4,11 +4,28 @@ Generate an expanded search evaluation dataset with 500+ labeled queries.
 This script generates synthetic but realistic query-document pairs for search evaluation.
 """
 
+import argparse
+import json
 import yaml
-from datetime import datetime
+from datetime import date
+from itertools import chain, cycle, islice, product
+
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as Dumper
+
+MAX_QUERIES = 510
+
+DUMP_OPTIONS = {
+    "Dumper": Dumper,
+    "default_flow_style": False,
+    "allow_unicode": True,
+    "sort_keys": False,
+}
 
 # Game names and variations
-GAMES = [
+GAMES = (
     "Valorant", "League of Legends", "Counter-Strike", "CSGO", "CS2", 
     "Fortnite", "Minecraft", "Among Us", "Apex Legends", "Overwatch",
     "Dota 2", "World of Warcraft", "Call of Duty", "Warzone", "Destiny 2",
@@ -18,35 +35,35 @@ GAMES = [
     "Path of Exile", "Diablo", "StarCraft", "Heroes of the Storm",
     "Team Fortress 2", "Paladins", "Smite", "Halo", "Battlefield",
     "The Elder Scrolls Online", "Guild Wars 2", "Black Desert Online"
-]
+)
 
 # Popular streamers/creators (fictional for this example)
-CREATORS = [
+CREATORS = (
     "Shroud", "Ninja", "xQc", "Pokimane", "Disguised Toast", "Valkyrae",
     "TimTheTatman", "DrLupo", "Summit1g", "LIRIK", "Sodapoppin", "Asmongold"
-]
+)
 
 # Query intent types
-PLAY_TYPES = [
+PLAY_TYPES = (
     "ace", "clutch", "pentakill", "quadra", "triple kill", "highlight",
     "outplay", "comeback", "1v5", "1v4", "1v3", "no scope", "quickscope",
     "headshot", "flick", "reaction", "insane", "epic", "amazing", "crazy"
-]
+)
 
-EDUCATIONAL = [
+EDUCATIONAL = (
     "tutorial", "guide", "tips", "tricks", "how to", "strategy", "meta",
     "build", "settings", "aim training", "gameplay tips", "pro tips"
-]
+)
 
-FUNNY = [
+FUNNY = (
     "funny", "hilarious", "fails", "rage", "salt", "toxic", "troll",
     "meme", "wtf", "bug", "glitch", "unlucky", "comedy", "laugh"
-]
+)
 
-COMPETITIVE = [
+COMPETITIVE = (
     "tournament", "championship", "pro play", "esports", "competitive",
     "ranked", "challenger", "grandmaster", "immortal", "radiant"
-]
+)
 
 # Languages
 LANGUAGES = {
@@ -80,138 +97,129 @@ LANGUAGES = {
     }
 }
 
-def generate_queries():
-    """Generate 500+ evaluation queries with relevance labels."""
-    queries = []
-    query_id = 1
-    
-    # 1. Game-specific searches (150 queries)
-    for game in GAMES[:30]:
-        for play_type in PLAY_TYPES[:5]:
-            query = f"{game.lower()} {play_type}"
-            queries.append({
-                "id": f"eval-{query_id:03d}",
-                "query": query,
-                "description": f"User looking for {play_type} clips in {game}",
-                "relevant_documents": [
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-{play_type.replace(' ', '-')}-perfect-01",
-                     "relevance": 4, "reason": f"Perfect {play_type} in {game}"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-{play_type.replace(' ', '-')}-good-02",
-                     "relevance": 3, "reason": f"Good {play_type} in {game}"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-similar-03",
-                     "relevance": 2, "reason": f"{game} content, related to {play_type}"},
-                    {"clip_id": f"other-game-{play_type.replace(' ', '-')}-04",
-                     "relevance": 1, "reason": f"{play_type} but wrong game"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-unrelated-05",
-                     "relevance": 0, "reason": f"{game} content but not {play_type}"}
-                ]
-            })
-            query_id += 1
-            if query_id > 150:
-                break
-        if query_id > 150:
-            break
-    
-    # 2. Creator-focused searches (60 queries)
-    for creator in CREATORS[:12]:
-        for play_type in ["gameplay", "highlights", "funny moments", "best of", "montage"]:
-            query = f"{creator.lower()} {play_type}"
-            queries.append({
-                "id": f"eval-{query_id:03d}",
-                "query": query,
-                "description": f"User looking for {play_type} from {creator}",
-                "relevant_documents": [
-                    {"clip_id": f"{creator.lower()}-{play_type.replace(' ', '-')}-01",
-                     "relevance": 4, "reason": f"{creator}'s {play_type}"},
-                    {"clip_id": f"{creator.lower()}-collab-02",
-                     "relevance": 3, "reason": f"{creator} in collaboration"},
-                    {"clip_id": f"{creator.lower()}-mentioned-03",
-                     "relevance": 1, "reason": f"{creator} mentioned but not featured"},
-                    {"clip_id": f"similar-creator-{play_type.replace(' ', '-')}-04",
-                     "relevance": 0, "reason": f"{play_type} but different creator"}
-                ]
-            })
-            query_id += 1
-            if query_id > 210:
-                break
-        if query_id > 210:
-            break
-    
-    # 3. Educational content (60 queries)
-    for game in GAMES[:15]:
-        for edu_type in EDUCATIONAL[:4]:
-            query = f"{game.lower()} {edu_type}"
-            queries.append({
-                "id": f"eval-{query_id:03d}",
-                "query": query,
-                "description": f"User looking for {edu_type} content for {game}",
-                "relevant_documents": [
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-{edu_type.replace(' ', '-')}-detailed-01",
-                     "relevance": 4, "reason": f"Comprehensive {edu_type} for {game}"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-{edu_type.replace(' ', '-')}-brief-02",
-                     "relevance": 3, "reason": f"Brief {edu_type} for {game}"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-gameplay-03",
-                     "relevance": 2, "reason": f"{game} gameplay, some educational value"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-entertainment-04",
-                     "relevance": 0, "reason": f"{game} content but not educational"}
-                ]
-            })
-            query_id += 1
-            if query_id > 270:
-                break
-        if query_id > 270:
-            break
-    
-    # 4. Funny/Entertainment content (50 queries)
-    for game in GAMES[:10]:
-        for funny_type in FUNNY[:5]:
-            query = f"{game.lower()} {funny_type}"
-            queries.append({
-                "id": f"eval-{query_id:03d}",
-                "query": query,
-                "description": f"User looking for {funny_type} content in {game}",
-                "relevant_documents": [
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-{funny_type}-hilarious-01",
-                     "relevance": 4, "reason": f"Very {funny_type} {game} moment"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-{funny_type}-good-02",
-                     "relevance": 3, "reason": f"{funny_type.capitalize()} {game} moment"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-mildly-{funny_type}-03",
-                     "relevance": 2, "reason": f"Mildly {funny_type}"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-serious-04",
-                     "relevance": 0, "reason": f"Serious {game} content"}
-                ]
-            })
-            query_id += 1
-            if query_id > 320:
-                break
-        if query_id > 320:
-            break
-    
-    # 5. Competitive/Esports (40 queries)
-    for game in GAMES[:10]:
-        for comp_type in COMPETITIVE[:4]:
-            query = f"{game.lower()} {comp_type}"
-            queries.append({
-                "id": f"eval-{query_id:03d}",
-                "query": query,
-                "description": f"User looking for {comp_type} content in {game}",
-                "relevant_documents": [
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-{comp_type.replace(' ', '-')}-top-01",
-                     "relevance": 4, "reason": f"Top-tier {comp_type} {game}"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-{comp_type.replace(' ', '-')}-mid-02",
-                     "relevance": 3, "reason": f"{comp_type.capitalize()} {game}"},
-                    {"clip_id": f"{game.lower().replace(' ', '-')}-casual-03",
-                     "relevance": 1, "reason": f"Casual {game}, not {comp_type}"}
-                ]
-            })
-            query_id += 1
-            if query_id > 360:
-                break
-        if query_id > 360:
-            break
-    
-    # 6. Multi-word complex queries (50 queries)
-    complex_queries = [
+# Content types searched for alongside a creator's name
+CREATOR_CONTENT = ("gameplay", "highlights", "funny moments", "best of", "montage")
+
+# Lowercased names, clip ID slugs and query IDs, computed once instead of per query
+GAME_NAMES = {game: game.lower() for game in GAMES}
+GAME_SLUGS = {game: name.replace(" ", "-") for game, name in GAME_NAMES.items()}
+CREATOR_NAMES = {creator: creator.lower() for creator in CREATORS}
+TERM_SLUGS = {
+    term: term.replace(" ", "-")
+    for terms in (PLAY_TYPES, EDUCATIONAL, COMPETITIVE, CREATOR_CONTENT, *LANGUAGES.values())
+    for term in terms
+}
+QUERY_IDS = tuple(f"eval-{query_id:03d}" for query_id in range(1, MAX_QUERIES + 1))
+
+
+def relevant_document(clip_id, relevance, reason):
+    """Build a labeled relevant document entry for a query."""
+    return {"clip_id": clip_id, "relevance": relevance, "reason": reason}
+
+
+def game_queries():
+    """Game-specific searches (150 queries)."""
+    for game, play_type in product(GAMES[:30], PLAY_TYPES[:5]):
+        query = f"{GAME_NAMES[game]} {play_type}"
+        yield {
+            "query": query,
+            "description": f"User looking for {play_type} clips in {game}",
+            "relevant_documents": [
+                relevant_document(f"{GAME_SLUGS[game]}-{TERM_SLUGS[play_type]}-perfect-01",
+                                  4, f"Perfect {play_type} in {game}"),
+                relevant_document(f"{GAME_SLUGS[game]}-{TERM_SLUGS[play_type]}-good-02",
+                                  3, f"Good {play_type} in {game}"),
+                relevant_document(f"{GAME_SLUGS[game]}-similar-03",
+                                  2, f"{game} content, related to {play_type}"),
+                relevant_document(f"other-game-{TERM_SLUGS[play_type]}-04",
+                                  1, f"{play_type} but wrong game"),
+                relevant_document(f"{GAME_SLUGS[game]}-unrelated-05",
+                                  0, f"{game} content but not {play_type}")
+            ]
+        }
+
+
+def creator_queries():
+    """Creator-focused searches (60 queries)."""
+    for creator, play_type in product(CREATORS[:12], CREATOR_CONTENT):
+        query = f"{CREATOR_NAMES[creator]} {play_type}"
+        yield {
+            "query": query,
+            "description": f"User looking for {play_type} from {creator}",
+            "relevant_documents": [
+                relevant_document(f"{CREATOR_NAMES[creator]}-{TERM_SLUGS[play_type]}-01",
+                                  4, f"{creator}'s {play_type}"),
+                relevant_document(f"{CREATOR_NAMES[creator]}-collab-02",
+                                  3, f"{creator} in collaboration"),
+                relevant_document(f"{CREATOR_NAMES[creator]}-mentioned-03",
+                                  1, f"{creator} mentioned but not featured"),
+                relevant_document(f"similar-creator-{TERM_SLUGS[play_type]}-04",
+                                  0, f"{play_type} but different creator")
+            ]
+        }
+
+
+def educational_queries():
+    """Educational content (60 queries)."""
+    for game, edu_type in product(GAMES[:15], EDUCATIONAL[:4]):
+        query = f"{GAME_NAMES[game]} {edu_type}"
+        yield {
+            "query": query,
+            "description": f"User looking for {edu_type} content for {game}",
+            "relevant_documents": [
+                relevant_document(f"{GAME_SLUGS[game]}-{TERM_SLUGS[edu_type]}-detailed-01",
+                                  4, f"Comprehensive {edu_type} for {game}"),
+                relevant_document(f"{GAME_SLUGS[game]}-{TERM_SLUGS[edu_type]}-brief-02",
+                                  3, f"Brief {edu_type} for {game}"),
+                relevant_document(f"{GAME_SLUGS[game]}-gameplay-03",
+                                  2, f"{game} gameplay, some educational value"),
+                relevant_document(f"{GAME_SLUGS[game]}-entertainment-04",
+                                  0, f"{game} content but not educational")
+            ]
+        }
+
+
+def funny_queries():
+    """Funny/Entertainment content (50 queries)."""
+    for game, funny_type in product(GAMES[:10], FUNNY[:5]):
+        query = f"{GAME_NAMES[game]} {funny_type}"
+        yield {
+            "query": query,
+            "description": f"User looking for {funny_type} content in {game}",
+            "relevant_documents": [
+                relevant_document(f"{GAME_SLUGS[game]}-{funny_type}-hilarious-01",
+                                  4, f"Very {funny_type} {game} moment"),
+                relevant_document(f"{GAME_SLUGS[game]}-{funny_type}-good-02",
+                                  3, f"{funny_type.capitalize()} {game} moment"),
+                relevant_document(f"{GAME_SLUGS[game]}-mildly-{funny_type}-03",
+                                  2, f"Mildly {funny_type}"),
+                relevant_document(f"{GAME_SLUGS[game]}-serious-04",
+                                  0, f"Serious {game} content")
+            ]
+        }
+
+
+def competitive_queries():
+    """Competitive/Esports (40 queries)."""
+    for game, comp_type in product(GAMES[:10], COMPETITIVE[:4]):
+        query = f"{GAME_NAMES[game]} {comp_type}"
+        yield {
+            "query": query,
+            "description": f"User looking for {comp_type} content in {game}",
+            "relevant_documents": [
+                relevant_document(f"{GAME_SLUGS[game]}-{TERM_SLUGS[comp_type]}-top-01",
+                                  4, f"Top-tier {comp_type} {game}"),
+                relevant_document(f"{GAME_SLUGS[game]}-{TERM_SLUGS[comp_type]}-mid-02",
+                                  3, f"{comp_type.capitalize()} {game}"),
+                relevant_document(f"{GAME_SLUGS[game]}-casual-03",
+                                  1, f"Casual {game}, not {comp_type}")
+            ]
+        }
+
+
+def multi_word_queries():
+    """Multi-word complex queries (50 queries)."""
+    complex_queries = (
         ("insane clutch 1v5", "User looking for impressive 1v5 clutch plays"),
         ("funny rage quit moments", "User looking for rage quit compilations"),
         ("pro player tutorial tips", "User looking for educational content from pros"),
@@ -222,56 +230,45 @@ def generate_queries():
         ("insane reaction time", "User looking for fast reaction plays"),
         ("unbelievable lucky shot", "User looking for lucky moments"),
         ("perfectly timed ultimate", "User looking for perfect ability timing")
-    ]
+    )
     
-    for i, (query, description) in enumerate(complex_queries * 5):  # Repeat to get 50
-        queries.append({
-            "id": f"eval-{query_id:03d}",
+    for i, (query, description) in enumerate(islice(cycle(complex_queries), 50)):
+        yield {
             "query": query,
             "description": description,
             "relevant_documents": [
-                {"clip_id": f"complex-perfect-{i}-01", "relevance": 4, 
-                 "reason": "Matches all query concepts perfectly"},
-                {"clip_id": f"complex-good-{i}-02", "relevance": 3,
-                 "reason": "Matches most query concepts"},
-                {"clip_id": f"complex-partial-{i}-03", "relevance": 2,
-                 "reason": "Matches some query concepts"},
-                {"clip_id": f"complex-tangential-{i}-04", "relevance": 1,
-                 "reason": "Tangentially related"},
-                {"clip_id": f"complex-unrelated-{i}-05", "relevance": 0,
-                 "reason": "Not related"}
+                relevant_document(f"complex-perfect-{i}-01",
+                                  4, "Matches all query concepts perfectly"),
+                relevant_document(f"complex-good-{i}-02", 3, "Matches most query concepts"),
+                relevant_document(f"complex-partial-{i}-03", 2, "Matches some query concepts"),
+                relevant_document(f"complex-tangential-{i}-04", 1, "Tangentially related"),
+                relevant_document(f"complex-unrelated-{i}-05", 0, "Not related")
             ]
-        })
-        query_id += 1
-        if query_id > 410:
-            break
-    
-    # 7. Multilingual queries (40 queries)
+        }
+
+
+def multilingual_queries():
+    """Multilingual queries (20 queries)."""
     for lang_code, translations in LANGUAGES.items():
         for eng_phrase, translation in translations.items():
-            queries.append({
-                "id": f"eval-{query_id:03d}",
+            yield {
                 "query": translation,
                 "description": f"{lang_code.upper()} search for '{eng_phrase}'",
                 "relevant_documents": [
-                    {"clip_id": f"{lang_code}-{eng_phrase.replace(' ', '-')}-native-01",
-                     "relevance": 4, "reason": f"Native {lang_code.upper()} content matching query"},
-                    {"clip_id": f"en-{eng_phrase.replace(' ', '-')}-02",
-                     "relevance": 3, "reason": f"English content, matches concept"},
-                    {"clip_id": f"{lang_code}-related-03",
-                     "relevance": 2, "reason": f"{lang_code.upper()} content, related"},
-                    {"clip_id": f"other-lang-04",
-                     "relevance": 1, "reason": "Different language"}
+                    relevant_document(f"{lang_code}-{TERM_SLUGS[eng_phrase]}-native-01",
+                                      4, f"Native {lang_code.upper()} content matching query"),
+                    relevant_document(f"en-{TERM_SLUGS[eng_phrase]}-02",
+                                      3, f"English content, matches concept"),
+                    relevant_document(f"{lang_code}-related-03",
+                                      2, f"{lang_code.upper()} content, related"),
+                    relevant_document(f"other-lang-04", 1, "Different language")
                 ]
-            })
-            query_id += 1
-            if query_id > 450:
-                break
-        if query_id > 450:
-            break
-    
-    # 8. Typo tolerance and edge cases (50 queries)
-    typo_pairs = [
+            }
+
+
+def typo_queries():
+    """Typo tolerance and edge cases (20 queries)."""
+    typo_pairs = (
         ("valoarnt", "valorant"), ("leauge", "league"), ("mincraft", "minecraft"),
         ("csog", "csgo"), ("forntite", "fortnite"), ("overwtach", "overwatch"),
         ("dota2", "dota 2"), ("apexlegends", "apex legends"), ("lol", "league of legends"),
@@ -279,64 +276,78 @@ def generate_queries():
         ("wow", "world of warcraft"), ("ff14", "final fantasy xiv"), ("poe", "path of exile"),
         ("r6", "rainbow six"), ("rl", "rocket league"), ("tft", "teamfight tactics"),
         ("ow", "overwatch"), ("pubg", "playerunknown's battlegrounds")
-    ]
+    )
     
     for i, (typo, correct) in enumerate(typo_pairs[:50]):
-        queries.append({
-            "id": f"eval-{query_id:03d}",
+        correct_slug = correct.replace(" ", "-")
+        yield {
             "query": typo,
             "description": f"Typo/abbreviation test for '{correct}'",
             "relevant_documents": [
-                {"clip_id": f"{correct.replace(' ', '-')}-exact-{i}-01",
-                 "relevance": 4, "reason": f"Should match {correct} despite typo"},
-                {"clip_id": f"{correct.replace(' ', '-')}-good-{i}-02",
-                 "relevance": 3, "reason": f"Related to {correct}"},
-                {"clip_id": f"similar-sounding-{i}-03",
-                 "relevance": 1, "reason": "Similar but different"},
-                {"clip_id": f"unrelated-{i}-04",
-                 "relevance": 0, "reason": "Not related"}
+                relevant_document(f"{correct_slug}-exact-{i}-01",
+                                  4, f"Should match {correct} despite typo"),
+                relevant_document(f"{correct_slug}-good-{i}-02", 3, f"Related to {correct}"),
+                relevant_document(f"similar-sounding-{i}-03", 1, "Similar but different"),
+                relevant_document(f"unrelated-{i}-04", 0, "Not related")
             ]
-        })
-        query_id += 1
-        if query_id > 500:
-            break
-    
-    # 9. Single-word queries (50 queries)
-    single_words = ["clutch", "ace", "montage", "tutorial", "funny", "epic", "insane", 
-                    "pro", "noob", "fail", "win", "lose", "best", "worst", "new"]
-    for i, word in enumerate(single_words * 4):  # Repeat to get enough
-        queries.append({
-            "id": f"eval-{query_id:03d}",
+        }
+
+
+def single_word_queries():
+    """Single-word queries (60 queries)."""
+    single_words = ("clutch", "ace", "montage", "tutorial", "funny", "epic", "insane", 
+                    "pro", "noob", "fail", "win", "lose", "best", "worst", "new")
+    for i, word in enumerate(islice(cycle(single_words), 60)):
+        yield {
             "query": word,
             "description": f"Single-word search: '{word}'",
             "relevant_documents": [
-                {"clip_id": f"{word}-title-{i}-01", "relevance": 4,
-                 "reason": f"'{word}' in title"},
-                {"clip_id": f"{word}-description-{i}-02", "relevance": 3,
-                 "reason": f"'{word}' in description"},
-                {"clip_id": f"{word}-related-{i}-03", "relevance": 2,
-                 "reason": f"Related to '{word}'"},
-                {"clip_id": f"unrelated-{i}-04", "relevance": 0,
-                 "reason": "Not related"}
+                relevant_document(f"{word}-title-{i}-01", 4, f"'{word}' in title"),
+                relevant_document(f"{word}-description-{i}-02", 3, f"'{word}' in description"),
+                relevant_document(f"{word}-related-{i}-03", 2, f"Related to '{word}'"),
+                relevant_document(f"unrelated-{i}-04", 0, "Not related")
             ]
-        })
-        query_id += 1
-        if query_id > 550:
-            break
-    
-    return queries[:510]  # Return exactly 510 queries
+        }
+
+
+# Query sections in the order their IDs are assigned
+SECTIONS = (
+    game_queries,
+    creator_queries,
+    educational_queries,
+    funny_queries,
+    competitive_queries,
+    multi_word_queries,
+    multilingual_queries,
+    typo_queries,
+    single_word_queries,
+)
+
+
+def iter_queries():
+    """Yield 500+ evaluation queries with relevance labels, one at a time."""
+    queries = chain.from_iterable(section() for section in SECTIONS)
+    for query_id, query in zip(QUERY_IDS, queries):
+        yield {"id": query_id, **query}
 
 
 def generate_dataset():
-    """Generate the complete dataset structure."""
-    queries = generate_queries()
+    """Generate the complete dataset structure.
+
+    ``evaluation_queries`` holds the ``iter_queries`` generator function
+    rather than the queries themselves, so the dict can be written more than
+    once. Use ``write_dataset`` to serialize it without materializing every
+    query in memory, or call the factory to get a fresh iterator.
+    """
+    # Read the clock once so every date field agrees, even across midnight
+    today = date.today().isoformat()
     
     dataset = {
         "version": "2.0",
         "description": "Expanded labeled evaluation dataset with 500+ queries for semantic search quality metrics",
-        "created_at": datetime.now().strftime("%Y-%m-%d"),
-        "last_updated": datetime.now().strftime("%Y-%m-%d"),
-        "evaluation_queries": queries,
+        "created_at": today,
+        "last_updated": today,
+        "evaluation_queries": iter_queries,
         "metric_targets": {
             "ndcg_at_5": {
                 "target": 0.75,
@@ -405,7 +416,7 @@ def generate_dataset():
         "changelog": [
             {
                 "version": "2.0",
-                "date": datetime.now().strftime("%Y-%m-%d"),
+                "date": today,
                 "changes": [
                     "Expanded dataset to 510 labeled queries (from 15)",
                     "Added precision/recall@20 metrics",
@@ -434,14 +445,60 @@ def generate_dataset():
     return dataset
 
 
+def write_dataset(dataset, f):
+    """Write the dataset as YAML, emitting evaluation queries one at a time.
+
+    Returns the number of evaluation queries written.
+    """
+    count = 0
+    for key, value in dataset.items():
+        if key == "evaluation_queries":
+            # Block sequences under a top-level key are not indented, so each
+            # query dumped as a one-item list lines up exactly as yaml.dump
+            # would have emitted it for the full list.
+            f.write(f"{key}:\n")
+            for query in value():
+                yaml.dump([query], f, **DUMP_OPTIONS)
+                count += 1
+        else:
+            yaml.dump({key: value}, f, **DUMP_OPTIONS)
+    return count
+
+
+def write_dataset_json(dataset, f):
+    """Write the dataset as indented JSON.
+
+    Returns the number of evaluation queries written.
+    """
+    queries = list(dataset["evaluation_queries"]())
+    json.dump({**dataset, "evaluation_queries": queries}, f, indent=2, ensure_ascii=False)
+    f.write("\n")
+    return len(queries)
+
+
+WRITERS = {
+    "yaml": write_dataset,
+    "json": write_dataset_json,
+}
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--format",
+        choices=WRITERS,
+        default="yaml",
+        help="output format; the search evaluation tools read YAML (default: yaml)",
+    )
+    args = parser.parse_args()
+    
     dataset = generate_dataset()
-    print(f"Generated {len(dataset['evaluation_queries'])} evaluation queries")
     
     # Write to file
-    output_path = "../testdata/search_evaluation_dataset.yaml"
-    with open(output_path, "w") as f:
-        yaml.dump(dataset, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    output_path = f"../testdata/search_evaluation_dataset.{args.format}"
+    with open(output_path, "w", encoding="utf-8") as f:
+        count = WRITERS[args.format](dataset, f)
     
+    print(f"Generated {count} evaluation queries")
     print(f"Dataset written to {output_path}")
     print(f"Metrics defined: {', '.join(dataset['metric_targets'].keys())}")